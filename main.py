@@ -6,27 +6,50 @@ Resquisitos:
 
 from __future__ import annotations
 
-import argparse
+import functools
 import json
 import os
+import re
 import shutil
 import signal
 import subprocess
 import sys
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
+try:
+	# Opcional: parser JSON más rápido si está instalado
+	import orjson
+except ImportError:
+	orjson = None
 
-@dataclass
+if TYPE_CHECKING:
+	import argparse
+
+
+@dataclass(frozen=True)
 class ConfigTunel:
-	# Configuración base del túnel
+	# Configuración base del túnel (inmutable y con __slots__)
+	# __slots__ explícito porque dataclass(slots=True) requiere Python 3.10
+	__slots__ = (
+		"usuario",
+		"host",
+		"puerto",
+		"archivo_identidad",
+		"sin_pty",
+		"keepalive",
+		"args_ssh_extra",
+		"multiplexar",
+	)
+
 	usuario: Optional[str]
 	host: str
 	puerto: int
 	archivo_identidad: Optional[str]
 	sin_pty: bool
 	keepalive: int
-	args_ssh_extra: List[str]
+	args_ssh_extra: Tuple[str, ...]
+	multiplexar: bool
 
 	def destino(self) -> str:
 		# Devuelve la cadena user@host o solo host si no hay usuario
@@ -35,129 +58,360 @@ class ConfigTunel:
 		return self.host
 
 
-def _requerir_ssh() -> None:
-	# Verifica que el cliente SSH esté disponible
-	if shutil.which("ssh") is None:
+class _ErrorFormato(ValueError):
+	# Formato de reenvío inválido (no depende de argparse)
+	pass
+
+
+# Configuración ya leída en esta ejecución, indexada por (ruta, mtime)
+_CACHE_CONFIG: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+# Última configuración leída o guardada (para saltar escrituras sin cambios)
+_ULTIMO_CONFIG: Optional[Dict[str, Any]] = None
+
+
+def _senales_disponibles(*nombres: str) -> Tuple[int, ...]:
+	# Filtra las señales que existen en la plataforma actual
+	return tuple(getattr(signal, nombre) for nombre in nombres if hasattr(signal, nombre))
+
+
+# Señales de teclado (Ctrl+C, Ctrl+\): la terminal ya las entrega a ssh porque
+# comparte grupo de procesos con nosotros, así que aquí se ignoran
+_SENALES_TERMINAL = _senales_disponibles("SIGINT", "SIGQUIT")
+
+# Señales que solo recibe este proceso y hay que reenviar a ssh
+_SENALES_REENVIO = _senales_disponibles("SIGTERM", "SIGHUP", "SIGUSR1", "SIGUSR2")
+
+# Ruta absoluta al cliente ssh (la resuelve _requerir_ssh una sola vez)
+_SSH_BIN = "ssh"
+
+
+def _requerir_ssh() -> str:
+	# Verifica que el cliente SSH esté disponible y guarda su ruta absoluta
+	global _SSH_BIN
+	ruta = shutil.which("ssh")
+	if ruta is None:
 		print("Error: no tienes instalado OpenSSH o no se encontró el comando 'ssh'. Instala 'openssh-client'.", file=sys.stderr)
 		sys.exit(1)
+	_SSH_BIN = ruta
+	return ruta
 
 
+@functools.lru_cache(maxsize=1)
 def _obtener_ruta_config() -> str:
-	# Ruta estándar en ~/.config/tunelssh/config.json
+	# Ruta estándar en ~/.config/tunelssh/config.json (se calcula una sola vez)
 	base = os.path.join(os.path.expanduser("~"), ".config", "tuneladorassh")
 	return os.path.join(base, "config.json")
 
 
+def _obtener_ruta_control() -> str:
+	# Socket de control para la multiplexación en ~/.ssh (ssh expande %r, %h y %p)
+	base = os.path.expanduser("~/.ssh")
+	os.makedirs(base, mode=0o700, exist_ok=True)
+	return os.path.join(base, "cm-%r@%h:%p")
+
+
+def _json_cargar(contenido: bytes) -> Any:
+	# Decodifica JSON desde bytes con orjson si está disponible
+	if orjson is not None:
+		return orjson.loads(contenido)
+	return json.loads(contenido)
+
+
+def _json_volcar(datos: Any) -> bytes:
+	# Serializa a JSON indentado (UTF-8) con orjson si está disponible
+	if orjson is not None:
+		return orjson.dumps(datos, option=orjson.OPT_INDENT_2)
+	return json.dumps(datos, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def _cargar_config() -> Dict[str, Any]:
 	# Carga configuración persistente si existe
+	global _ULTIMO_CONFIG
 	ruta = _obtener_ruta_config()
-	if not os.path.exists(ruta):
-		return {}
 	try:
-		with open(ruta, "r", encoding="utf-8") as archivo:
-			return json.load(archivo)
-	except (OSError, json.JSONDecodeError):
+		mtime = os.stat(ruta).st_mtime_ns
+	except OSError:
+		# No existe o no es accesible
 		return {}
+	clave = (ruta, mtime)
+	datos = _CACHE_CONFIG.get(clave)
+	if datos is None:
+		try:
+			with open(ruta, "rb") as archivo:
+				datos = _json_cargar(archivo.read())
+		except (OSError, ValueError):
+			return {}
+		_CACHE_CONFIG[clave] = datos
+	# Recordamos lo que hay en disco para no reescribirlo si no cambia
+	_ULTIMO_CONFIG = datos
+	return datos
 
 
 def _guardar_config(datos: Dict[str, Any]) -> None:
 	# Guarda configuración persistente en disco ~/.config/tunelssh/config.json
+	global _ULTIMO_CONFIG
+	if datos == _ULTIMO_CONFIG:
+		# Nada ha cambiado desde la última lectura: evitamos la escritura y el fsync
+		return
 	ruta = _obtener_ruta_config()
 	os.makedirs(os.path.dirname(ruta), exist_ok=True)
-	with open(ruta, "w", encoding="utf-8") as archivo:
-		json.dump(datos, archivo, ensure_ascii=False, indent=2)
+	# Escribimos en un temporal y lo renombramos: nunca queda un config.json a medias
+	temporal = ruta + ".tmp"
+	try:
+		with open(temporal, "wb") as archivo:
+			archivo.write(_json_volcar(datos))
+			archivo.flush()
+			os.fsync(archivo.fileno())
+		os.replace(temporal, ruta)
+	except BaseException:
+		try:
+			os.remove(temporal)
+		except OSError:
+			pass
+		raise
+	# El contenido en disco ha cambiado: invalidamos la caché
+	_CACHE_CONFIG.clear()
+	_ULTIMO_CONFIG = datos
 
 
 def _obtener_entero_config(valor: Any, defecto: int) -> int:
-	# Convierte un valor de configuración a entero 
-	if isinstance(valor, int):
-		return valor
-	if isinstance(valor, str):
-		texto = valor.strip()
-		if texto.isdigit():
-			return int(texto)
-	return defecto
+	# Convierte un valor de configuración a entero (acepta negativos y espacios)
+	# Solo int o str: los floats no se truncan y el resto de tipos usan el defecto
+	if not isinstance(valor, (int, str)):
+		return defecto
+	try:
+		return int(valor)
+	except ValueError:
+		return defecto
 
 
 def _construir_args_ssh_base(cfg: ConfigTunel) -> List[str]:
-	# Construye los argumentos base para el comando ssh
-	args = ["ssh"]
-
-	if cfg.sin_pty:
-		args.append("-T")
-
-	args += [
+	# Construye los argumentos base para el comando ssh en una sola pasada
+	args = (
+		_SSH_BIN,
+		*(("-T",) if cfg.sin_pty else ()),
 		"-o",
 		"ExitOnForwardFailure=yes",
 		"-o",
 		f"ServerAliveInterval={cfg.keepalive}",
 		"-o",
 		"ServerAliveCountMax=3",
-	]
+		# Reutiliza una conexión maestra entre ejecuciones (sin nuevo handshake)
+		*(
+			(
+				"-o",
+				"ControlMaster=auto",
+				"-o",
+				f"ControlPath={_obtener_ruta_control()}",
+				"-o",
+				"ControlPersist=600",
+			)
+			if cfg.multiplexar
+			else ()
+		),
+		*(("-i", cfg.archivo_identidad) if cfg.archivo_identidad else ()),
+		*(("-p", str(cfg.puerto)) if cfg.puerto != 22 else ()),
+		*cfg.args_ssh_extra,
+	)
+	return list(args)
+
+
+def _codigo_salida(estado: int) -> int:
+	# Traduce el estado de waitpid al mismo convenio que Popen.wait()
+	if os.WIFSIGNALED(estado):
+		return -os.WTERMSIG(estado)
+	return os.WEXITSTATUS(estado)
 
-	if cfg.archivo_identidad:
-		args += ["-i", cfg.archivo_identidad]
 
-	if cfg.puerto != 22:
-		args += ["-p", str(cfg.puerto)]
+def _ignorar_senales_terminal() -> None:
+	# El padre ignora Ctrl+C/Ctrl+\ para no entregarlas dos veces a ssh
+	for senal in _SENALES_TERMINAL:
+		signal.signal(senal, signal.SIG_IGN)
 
-	if cfg.args_ssh_extra:
-		args += cfg.args_ssh_extra
 
-	return args
+def _restaurar_senales_terminal() -> None:
+	# En el hijo: vuelve al comportamiento por defecto antes del exec
+	for senal in _SENALES_TERMINAL:
+		signal.signal(senal, signal.SIG_DFL)
+
+
+def _reenviar_senales(reenviar) -> None:
+	# Instala el manejador que reenvía las señales al proceso ssh
+	def _manejar_senal(signo: int, _frame) -> None:
+		try:
+			reenviar(signo)
+		except ProcessLookupError:
+			return
+
+	for senal in _SENALES_REENVIO:
+		signal.signal(senal, _manejar_senal)
+
+
+def _descriptores_heredados() -> Optional[List[int]]:
+	# Descriptores heredables (> 2) abiertos en este proceso, o None si no se pueden listar
+	for directorio in ("/proc/self/fd", "/dev/fd"):
+		try:
+			nombres = os.listdir(directorio)
+		except OSError:
+			continue
+		heredables = []
+		for nombre in nombres:
+			fd = int(nombre)
+			if fd <= 2:
+				continue
+			try:
+				if os.get_inheritable(fd):
+					heredables.append(fd)
+			except OSError:
+				# El propio descriptor usado para listar el directorio ya está cerrado
+				continue
+		return heredables
+	return None
 
 
 def _ejecutar_ssh(args: List[str]) -> int:
 	# Ejecuta el comando ssh y reenvía señales
+	if not hasattr(os, "posix_spawn"):
+		return _ejecutar_ssh_popen(args)
+
+	# posix_spawn no cierra descriptores por sí mismo: PEP 446 solo cubre los que
+	# abre Python, así que cerramos los heredables que nos haya pasado el proceso
+	# padre (igual que close_fds=True), recorriendo solo los que están abiertos
+	heredados = _descriptores_heredados()
+	if heredados is None:
+		return _ejecutar_ssh_popen(args)
+
+	_ignorar_senales_terminal()
 	try:
-		proc = subprocess.Popen(args)
-	except FileNotFoundError:
+		# posix_spawn evita copiar el espacio de memoria del intérprete (fork)
+		pid = os.posix_spawn(
+			args[0],
+			args,
+			os.environ,
+			file_actions=[(os.POSIX_SPAWN_CLOSE, fd) for fd in heredados],
+			setsigdef=_SENALES_TERMINAL,
+		)
+	except OSError:
 		print("Error: no se pudo ejecutar 'ssh'.", file=sys.stderr)
 		return 1
 
-	def _manejar_senal(signo: int, _frame) -> None:
-		try:
-			proc.send_signal(signo)
-		except ProcessLookupError:
-			return
+	_reenviar_senales(lambda signo: os.kill(pid, signo))
+
+	_, estado = os.waitpid(pid, 0)
+	return _codigo_salida(estado)
+
+
+def _ejecutar_ssh_popen(args: List[str]) -> int:
+	# Alternativa con subprocess para plataformas sin posix_spawn
+	# (close_fds usa /proc/self/fd cuando existe en lugar de cerrar hasta RLIMIT_NOFILE)
+	_ignorar_senales_terminal()
+	# preexec_fn solo existe en POSIX (en Windows Popen lanza ValueError)
+	extra: Dict[str, Any] = {}
+	if os.name == "posix":
+		extra["preexec_fn"] = _restaurar_senales_terminal
+	try:
+		# args[0] ya es la ruta absoluta: evitamos otra búsqueda en $PATH
+		proc = subprocess.Popen(args, executable=args[0], close_fds=True, **extra)
+	except FileNotFoundError:
+		print("Error: no se pudo ejecutar 'ssh'.", file=sys.stderr)
+		return 1
 
-	signal.signal(signal.SIGINT, _manejar_senal)
-	signal.signal(signal.SIGTERM, _manejar_senal)
+	_reenviar_senales(proc.send_signal)
 
 	return proc.wait()
 
 
+def _reemplazar_por_ssh(args: List[str]) -> int:
+	# Sustituye este proceso por ssh: no queda Python en medio reenviando señales
+	sys.stdout.flush()
+	sys.stderr.flush()
+	try:
+		# args[0] ya es la ruta absoluta (ver _requerir_ssh): sin búsqueda en $PATH
+		os.execv(args[0], args)
+	except OSError:
+		print("Error: no se pudo ejecutar 'ssh'.", file=sys.stderr)
+	return 1
+
+
+# Mensaje de error de formato para cada tipo de reenvío
+_MENSAJES_FORMATO = {
+	"local": "Formato inválido. Deberías utilizar algo como: [bind_address:]local_port:dest_host:dest_port",
+	"remoto": "Formato inválido. Deberías utilizar algo como: [bind_address:]remote_port:dest_host:dest_port",
+	"socks": "Formato inválido. Deberías utilizar algo como: [bind_address:]socks_port",
+}
+
+
+# Patrones precompilados: [bind_address:] opcional y puede ir vacío (todas las
+# interfaces, p. ej. ":8080:host:80" o ":1080"); el resto de segmentos no
+_RE_REENVIO = re.compile(r"(?:[^:]*:)?[^:]+:[^:]+:[^:]+")
+_RE_SOCKS = re.compile(r"(?:[^:]*:)?[^:]+")
+
+
+def _validar_reenvio(valor: str, tipo: str) -> str:
+	# Formato: [bind_address:]puerto:dest_host:dest_port
+	if not _RE_REENVIO.fullmatch(valor):
+		raise _ErrorFormato(_MENSAJES_FORMATO[tipo])
+	return valor
+
+
 def _validar_reenvio_local(valor: str) -> str:
 	# Formato: [bind_address:]local_port:dest_host:dest_port
-	partes = valor.split(":")
-	if len(partes) not in (3, 4):
-		raise argparse.ArgumentTypeError(
-			"Formato inválido. Deberías utilizar algo como: [bind_address:]local_port:dest_host:dest_port"
-		)
-	return valor
+	return _validar_reenvio(valor, "local")
 
 
 def _validar_reenvio_remoto(valor: str) -> str:
 	# Formato: [bind_address:]remote_port:dest_host:dest_port
-	partes = valor.split(":")
-	if len(partes) not in (3, 4):
-		raise argparse.ArgumentTypeError(
-			"Formato inválido. Deberías utilizar algo como: [bind_address:]remote_port:dest_host:dest_port"
-		)
-	return valor
+	return _validar_reenvio(valor, "remoto")
 
 
 def _validar_socks(valor: str) -> str:
 	# Formato: [bind_address:]socks_port
-	partes = valor.split(":")
-	if len(partes) not in (1, 2):
-		raise argparse.ArgumentTypeError("Formato inválido. Deberías utilizar algo como: [bind_address:]socks_port")
+	if not _RE_SOCKS.fullmatch(valor):
+		raise _ErrorFormato(_MENSAJES_FORMATO["socks"])
 	return valor
 
 
+# Validador y ejemplo de reenvío para cada modo
+_VALIDADORES: Dict[str, Callable[[str], str]] = {
+	"local": _validar_reenvio_local,
+	"remoto": _validar_reenvio_remoto,
+	"socks": _validar_socks,
+}
+
+_AYUDA_REENVIO = {
+	"local": "Ejemplo local: 8080:127.0.0.1:80 o 0.0.0.0:8080:127.0.0.1:80",
+	"remoto": "Ejemplo remoto: 9090:127.0.0.1:22",
+	"socks": "Ejemplo socks: 1080 o 127.0.0.1:1080",
+}
+
+
+# Respuestas que muestran la ayuda del campo
+_PALABRAS_AYUDA = frozenset({"ayuda", "help", "?"})
+
+
+def _leer(prompt: str) -> str:
+	# Lee una línea de la consola; con TUNEL_READLINE se carga readline para que
+	# input() tenga edición de línea (input() solo la usa si el módulo está importado)
+	if os.environ.get("TUNEL_READLINE") and sys.stdin.isatty():
+		try:
+			import readline  # noqa: F401
+		except ImportError:
+			# Plataformas sin readline (p. ej. Windows): input() sin edición
+			pass
+		return input(prompt)
+	sys.stdout.write(prompt)
+	sys.stdout.flush()
+	linea = sys.stdin.readline()
+	if not linea:
+		# Mismo comportamiento que input() al llegar al final de la entrada
+		raise EOFError
+	return linea.rstrip("\r\n")
+
+
 def _es_solicitud_ayuda(entrada: str) -> bool:
 	# Detecta si el usuario pidió ayuda
-	return entrada.strip().lower() in {"ayuda", "help", "?"}
+	return entrada.strip().lower() in _PALABRAS_AYUDA
 
 
 def _pedir_texto(
@@ -169,7 +423,7 @@ def _pedir_texto(
 	# Solicita texto por consola con valor por defecto
 	while True:
 		if defecto:
-			entrada = input(f"{etiqueta} [{defecto}]: ").strip()
+			entrada = _leer(f"{etiqueta} [{defecto}]: ").strip()
 			if _es_solicitud_ayuda(entrada):
 				print(ayuda_texto or "Escribe el valor solicitado o deja vacío para usar el valor por defecto.")
 				continue
@@ -178,7 +432,7 @@ def _pedir_texto(
 			if defecto:
 				return defecto
 		else:
-			entrada = input(f"{etiqueta}: ").strip()
+			entrada = _leer(f"{etiqueta}: ").strip()
 			if _es_solicitud_ayuda(entrada):
 				print(ayuda_texto or "Escribe el valor solicitado.")
 				continue
@@ -190,7 +444,7 @@ def _pedir_texto(
 def _pedir_entero(etiqueta: str, defecto: int, ayuda_texto: Optional[str] = None) -> int:
 	# Solicita un entero por consola con valor por defecto
 	while True:
-		entrada = input(f"{etiqueta} [{defecto}]: ").strip()
+		entrada = _leer(f"{etiqueta} [{defecto}]: ").strip()
 		if _es_solicitud_ayuda(entrada):
 			print(ayuda_texto or "Introduce un número entero. Si dejas vacío, se usa el valor por defecto.")
 			continue
@@ -206,7 +460,7 @@ def _pedir_si_no(etiqueta: str, defecto: bool, ayuda_texto: Optional[str] = None
 	# Solicita un sí/no por consola
 	valor_defecto = "s" if defecto else "n"
 	while True:
-		entrada = input(f"{etiqueta} [s/n] ({valor_defecto}): ").strip().lower()
+		entrada = _leer(f"{etiqueta} [s/n] ({valor_defecto}): ").strip().lower()
 		if _es_solicitud_ayuda(entrada):
 			print(ayuda_texto or "Responde con s o n. Si dejas vacío, se usa el valor por defecto.")
 			continue
@@ -222,38 +476,51 @@ def _pedir_si_no(etiqueta: str, defecto: bool, ayuda_texto: Optional[str] = None
 def _pedir_lista(etiqueta: str, defecto: List[str], ayuda_texto: Optional[str] = None) -> List[str]:
 	# Solicita una lista separada por comas
 	texto_defecto = ",".join(defecto) if defecto else ""
-	entrada = input(f"{etiqueta} [{texto_defecto}]: ").strip()
-	if _es_solicitud_ayuda(entrada):
-		print(ayuda_texto or "Introduce valores separados por comas o deja vacío para usar el valor por defecto.")
-		return _pedir_lista(etiqueta, defecto, ayuda_texto)
-	if not entrada:
-		return defecto
-	return [item.strip() for item in entrada.split(",") if item.strip()]
+	while True:
+		entrada = _leer(f"{etiqueta} [{texto_defecto}]: ").strip()
+		if _es_solicitud_ayuda(entrada):
+			print(ayuda_texto or "Introduce valores separados por comas o deja vacío para usar el valor por defecto.")
+			continue
+		if not entrada:
+			return defecto
+		return [item.strip() for item in entrada.split(",") if item.strip()]
 
 
 def _pedir_reenvio(modo: str, defecto: str) -> str:
 	# Valida el formato del reenvío según el modo
-	if modo == "local":
-		ayuda_reenvio = "Ejemplo local: 8080:127.0.0.1:80 o 0.0.0.0:8080:127.0.0.1:80"
-	elif modo == "remoto":
-		ayuda_reenvio = "Ejemplo remoto: 9090:127.0.0.1:22"
-	else:
-		ayuda_reenvio = "Ejemplo socks: 1080 o 127.0.0.1:1080"
+	ayuda_reenvio = _AYUDA_REENVIO[modo]
+	validador = _VALIDADORES[modo]
 	while True:
 		entrada = _pedir_texto("Reenvío", defecto=defecto, obligatorio=True, ayuda_texto=ayuda_reenvio)
 		try:
-			if modo == "local":
-				return _validar_reenvio_local(entrada)
-			if modo == "remoto":
-				return _validar_reenvio_remoto(entrada)
-			if modo == "socks":
-				return _validar_socks(entrada)
-		except argparse.ArgumentTypeError as exc:
+			return validador(entrada)
+		except _ErrorFormato as exc:
 			print(str(exc))
 
 
-def _construir_parser() -> argparse.ArgumentParser:
+# Subcomandos de la línea de comandos
+_MODOS_CLI = ("local", "remoto", "socks", "interactivo", "ayuda")
+
+
+def _como_tipo_argparse(validador: Callable[[str], str]) -> Callable[[str], str]:
+	# Adapta un validador para que argparse muestre su mensaje de error
+	import argparse
+
+	@functools.wraps(validador)
+	def _tipo(valor: str) -> str:
+		try:
+			return validador(valor)
+		except _ErrorFormato as exc:
+			raise argparse.ArgumentTypeError(str(exc)) from exc
+
+	return _tipo
+
+
+def _construir_parser(solo_modo: Optional[str] = None) -> argparse.ArgumentParser:
 	# Parser de línea de comandos (modo no interactivo)
+	# argparse se importa aquí para que el modo interactivo no pague su coste
+	import argparse
+
 	parser = argparse.ArgumentParser(
 		prog="tunelssh",
 		description="TuneladoraSSH (local, remoto y dinámico).",
@@ -277,6 +544,11 @@ def _construir_parser() -> argparse.ArgumentParser:
 		dest="extra_ssh_args",
 		help="Argumento adicional para ssh (se puede repetir)",
 	)
+	parser.add_argument(
+		"--mux",
+		action="store_true",
+		help="Reutiliza la conexión SSH (ControlMaster); los reenvíos quedan en la conexión maestra",
+	)
 	parser.add_argument(
 		"--background",
 		"-f",
@@ -291,42 +563,59 @@ def _construir_parser() -> argparse.ArgumentParser:
 
 	sub = parser.add_subparsers(dest="modo", required=True)
 
-	local = sub.add_parser("local", help="Reenvío local (L)")
-	local.add_argument("host", help="Host remoto (IP o DNS)")
-	local.add_argument(
-		"--forward",
-		"-L",
-		required=True,
-		type=_validar_reenvio_local,
-		help="El formato que deberías usar es: [bind_address:]local_port:dest_host:dest_port",
-	)
+	def _incluir(modo: str) -> bool:
+		# Con un modo conocido solo se construye su subparser (y "ayuda")
+		return solo_modo is None or modo in (solo_modo, "ayuda")
+
+	if _incluir("local"):
+		local = sub.add_parser("local", help="Reenvío local (L)")
+		local.add_argument("host", help="Host remoto (IP o DNS)")
+		local.add_argument(
+			"--forward",
+			"-L",
+			required=True,
+			type=_como_tipo_argparse(_validar_reenvio_local),
+			help="El formato que deberías usar es: [bind_address:]local_port:dest_host:dest_port",
+		)
 
-	remoto = sub.add_parser("remoto", help="Reenvío remoto (R)")
-	remoto.add_argument("host", help="Host remoto (IP o DNS)")
-	remoto.add_argument(
-		"--forward",
-		"-R",
-		required=True,
-		type=_validar_reenvio_remoto,
-		help="El formato que deberías usar es: [bind_address:]remote_port:dest_host:dest_port",
-	)
+	if _incluir("remoto"):
+		remoto = sub.add_parser("remoto", help="Reenvío remoto (R)")
+		remoto.add_argument("host", help="Host remoto (IP o DNS)")
+		remoto.add_argument(
+			"--forward",
+			"-R",
+			required=True,
+			type=_como_tipo_argparse(_validar_reenvio_remoto),
+			help="El formato que deberías usar es: [bind_address:]remote_port:dest_host:dest_port",
+		)
 
-	dinamico = sub.add_parser("socks", help="SOCKS dinámico (D)")
-	dinamico.add_argument("host", help="Host remoto (IP o DNS)")
-	dinamico.add_argument(
-		"--forward",
-		"-D",
-		required=True,
-		type=_validar_socks,
-		help="El formato que deberías usar es: [bind_address:]socks_port",
-	)
+	if _incluir("socks"):
+		dinamico = sub.add_parser("socks", help="SOCKS dinámico (D)")
+		dinamico.add_argument("host", help="Host remoto (IP o DNS)")
+		dinamico.add_argument(
+			"--forward",
+			"-D",
+			required=True,
+			type=_como_tipo_argparse(_validar_socks),
+			help="El formato que deberías usar es: [bind_address:]socks_port",
+		)
 
-	sub.add_parser("interactivo", help="Modo interactivo con persistencia")
+	if _incluir("interactivo"):
+		sub.add_parser("interactivo", help="Modo interactivo con persistencia")
 	sub.add_parser("ayuda", help="Guía rápida de uso en terminal")
 
 	return parser
 
 
+def _detectar_modo(argv: List[str]) -> Optional[str]:
+	# Modo pedido si es el primer argumento y no se pide ayuda; None = parser completo
+	if len(argv) < 2 or argv[1] not in _MODOS_CLI:
+		return None
+	if "-h" in argv or "--help" in argv:
+		return None
+	return argv[1]
+
+
 def _mostrar_ayuda_terminal() -> None:
 	# Muestra una guía rápida para el modo no interactivo
 	print("Guía rápida (modo no interactivo):")
@@ -367,11 +656,18 @@ def _ejecutar_tunel(
 		args_ssh.append(comando)
 	else:
 		# Sin comando, se usa -N y opcionalmente -f
+		# (-f: ssh pasa a segundo plano tras autenticarse y abrir los reenvíos,
+		# así puede pedir contraseña y los errores llegan a la terminal)
 		args_ssh.append("-N")
 		if en_segundo_plano:
 			args_ssh.append("-f")
 		args_ssh.append(cfg.destino())
 
+	if not comando and not en_segundo_plano and os.name == "posix":
+		# Túnel en primer plano: Python no tiene nada más que hacer
+		# (solo en POSIX: en Windows os.execv lanza otro proceso y sale)
+		return _reemplazar_por_ssh(args_ssh)
+
 	return _ejecutar_ssh(args_ssh)
 
 
@@ -453,6 +749,15 @@ def _ejecutar_interactivo(argumentos_cli: Dict[str, Any]) -> int:
 		ayuda_texto="Opcional: opciones extra para ssh. Ej: -v,-o,StrictHostKeyChecking=no",
 	)
 
+	multiplexar = _pedir_si_no(
+		"Reutilizar conexión SSH (multiplexación)",
+		bool(config_guardada.get("multiplexar", False)),
+		ayuda_texto=(
+			"Si respondes s, las siguientes ejecuciones reutilizan la conexión abierta (ControlMaster).\n"
+			"Ojo: los reenvíos quedan en la conexión maestra y siguen activos hasta 10 minutos tras Ctrl+C."
+		),
+	)
+
 	defecto_reenvio = str(config_guardada.get("reenvio", ""))
 	reenvio = _pedir_reenvio(modo, defecto_reenvio)
 
@@ -476,7 +781,8 @@ def _ejecutar_interactivo(argumentos_cli: Dict[str, Any]) -> int:
 		archivo_identidad=archivo_identidad,
 		sin_pty=sin_pty,
 		keepalive=keepalive,
-		args_ssh_extra=args_ssh_extra,
+		args_ssh_extra=tuple(args_ssh_extra),
+		multiplexar=multiplexar,
 	)
 
 	# Guardamos la configuración para próximos usos
@@ -490,6 +796,7 @@ def _ejecutar_interactivo(argumentos_cli: Dict[str, Any]) -> int:
 			"sin_pty": sin_pty,
 			"keepalive": keepalive,
 			"args_ssh_extra": args_ssh_extra,
+			"multiplexar": multiplexar,
 			"reenvio": reenvio,
 			"en_segundo_plano": en_segundo_plano,
 			"comando": comando or "",
@@ -506,7 +813,7 @@ def principal() -> int:
 	if len(sys.argv) == 1:
 		return _ejecutar_interactivo({})
 
-	parser = _construir_parser()
+	parser = _construir_parser(_detectar_modo(sys.argv))
 	args = parser.parse_args()
 
 	if args.modo == "interactivo":
@@ -522,7 +829,8 @@ def principal() -> int:
 		archivo_identidad=args.identity,
 		sin_pty=args.no_pty,
 		keepalive=args.keepalive,
-		args_ssh_extra=args.extra_ssh_args,
+		args_ssh_extra=tuple(args.extra_ssh_args),
+		multiplexar=args.mux,
 	)
 
 	return _ejecutar_tunel(